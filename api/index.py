@@ -1,18 +1,108 @@
 # app.py - Flask Backend for AI News Hub
-from flask import Flask, jsonify, request, send_from_directory
+from flask import Flask, Response, jsonify, request, send_from_directory
+from flask.json.provider import JSONProvider
+from flask_compress import Compress
 from flask_cors import CORS
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from functools import wraps
+from logging.handlers import QueueHandler, QueueListener
+import atexit
+import hashlib
+import logging
+import orjson
+import queue
+import re
+import tempfile
+import threading
+import time
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.parser import HTMLParser
 import os
 from dotenv import load_dotenv
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
 
 # Load environment variables
 load_dotenv()
 
+# Logging - records are queued and written by a background listener thread,
+# so request handlers never block on stdout
+_log_queue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s'))
+_log_listener = QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+log = logging.getLogger('ainews')
+_log_level = logging.getLevelName(os.getenv('LOG_LEVEL', 'WARNING').upper())
+log.setLevel(_log_level if isinstance(_log_level, int) else logging.WARNING)
+log.addHandler(QueueHandler(_log_queue))
+log.propagate = False
+
 # Initialize Flask app
 app = Flask(__name__, static_folder='.')
 
+# Let a fronting nginx/apache serve static files via X-Sendfile when configured
+app.config['USE_X_SENDFILE'] = os.getenv('USE_X_SENDFILE', '').lower() in ('1', 'true')
+
+# Frontend lives in ../static relative to this file
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'static')
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson, which encodes straight to bytes"""
+
+    def dumps(self, obj, **kwargs):
+        option = 0
+        if kwargs.get('sort_keys'):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=kwargs.get('default'), option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype='application/json')
+
+
+app.json = OrjsonProvider(app)
+
+class _Compress(Compress):
+    """Flask-Compress that leaves X-Sendfile responses for the proxy to serve"""
+
+    def after_request(self, response):
+        if 'X-Sendfile' in response.headers:
+            return response
+        return super().after_request(response)
+
+
+# Compress JSON/HTML responses (brotli when the client supports it, else gzip)
+app.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/html', 'text/css', 'application/javascript']
+app.config['COMPRESS_LEVEL'] = 5
+app.config['COMPRESS_BR_LEVEL'] = 5
+app.config['COMPRESS_MIN_SIZE'] = 500
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+_Compress(app)
+
+# Flask-Compress turns ETag "abc" into "abc:br" after the view has run, and
+# browsers echo that back in If-None-Match
+_ETAG_ENCODING_RE = re.compile(r':(?:br|gzip|deflate)"')
+
+
+@app.before_request
+def _strip_etag_encoding():
+    """Drop the compression suffix from If-None-Match so conditional checks match"""
+    if_none_match = request.environ.get('HTTP_IF_NONE_MATCH')
+    if if_none_match:
+        request.environ['HTTP_IF_NONE_MATCH'] = _ETAG_ENCODING_RE.sub('"', if_none_match)
+
 # Configure CORS - Allow all origins for development
 CORS(app, resources={
     r"/*": {
@@ -28,58 +118,390 @@ GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
 
 NEWS_API_BASE = 'https://newsapi.org/v2'
 
+if not NEWS_API_KEY:
+    log.warning("NEWS_API_KEY not set - serving demo data. Get a free key at https://newsapi.org/register")
+
+# Shared HTTP session - reuses pooled TCP/TLS connections across requests
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=50,
+    pool_maxsize=50,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[502, 503, 504],
+        raise_on_status=False
+    )
+)
+SESSION.mount('https://', _adapter)
+SESSION.mount('http://', _adapter)
+SESSION.headers.update({'User-Agent': 'AI-News-Hub/1.0'})
+
+# ============= RESPONSE CACHE =============
+# In-process cache-aside store for News API responses:
+# key -> (expires_at, body, etag)
+_RESPONSE_CACHE = {}
+_RESPONSE_CACHE_LOCK = threading.Lock()
+_RESPONSE_CACHE_MAX = 256
+
+# In-flight cache misses: key -> Future resolving to (body, status, etag)
+_INFLIGHT = {}
+_INFLIGHT_LOCK = threading.Lock()
+# Waiters give up with a 504 after this long. It exceeds the owner's worst
+# case (10 s News API timeout x 4 attempts plus retry backoff).
+_INFLIGHT_TIMEOUT = 60
+
+
+def _cache_get(key):
+    """Return the cached (body, etag) for key, or None if missing/expired"""
+    with _RESPONSE_CACHE_LOCK:
+        entry = _RESPONSE_CACHE.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.time():
+            del _RESPONSE_CACHE[key]
+            return None
+        return entry[1], entry[2]
+
+
+def _cache_set(key, body, etag, ttl):
+    """Store body under key for ttl seconds, evicting old entries when full"""
+    now = time.time()
+    with _RESPONSE_CACHE_LOCK:
+        if len(_RESPONSE_CACHE) >= _RESPONSE_CACHE_MAX:
+            for k in [k for k, entry in _RESPONSE_CACHE.items() if entry[0] < now]:
+                del _RESPONSE_CACHE[k]
+            while len(_RESPONSE_CACHE) >= _RESPONSE_CACHE_MAX:
+                del _RESPONSE_CACHE[next(iter(_RESPONSE_CACHE))]
+        _RESPONSE_CACHE[key] = (now + ttl, body, etag)
+
+
+def _etag_response(body, etag, max_age):
+    """Build a cacheable JSON response, or an empty 304 if the client has etag.
+
+    If-None-Match has already had any compression suffix removed by
+    _strip_etag_encoding, so it is compared with the bare tag directly.
+    """
+    if request.method in ('GET', 'HEAD') and request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    return response
+
+
+def cached(ttl, key_fn):
+    """Cache successful JSON responses of a view for ttl seconds.
+
+    key_fn is called inside the request and returns the cache key, or None
+    to bypass the cache for that request. Concurrent misses on the same key
+    are coalesced so only one of them calls the view. Successful responses
+    carry an ETag so repeat GETs can be answered with 304 Not Modified.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            key = key_fn() if request.method != 'OPTIONS' else None
+            if key is None:
+                return view(*args, **kwargs)
+
+            hit = _cache_get(key)
+            if hit is not None:
+                return _etag_response(hit[0], hit[1], ttl)
+
+            with _INFLIGHT_LOCK:
+                # A previous owner may have filled the cache since the check above
+                hit = _cache_get(key)
+                if hit is None:
+                    future = _INFLIGHT.get(key)
+                    owner = future is None
+                    if owner:
+                        future = _INFLIGHT[key] = Future()
+
+            if hit is not None:
+                return _etag_response(hit[0], hit[1], ttl)
+
+            if not owner:
+                # Identical request already in flight - share its result rather
+                # than adding another upstream call while it is slow
+                try:
+                    body, status, etag = future.result(timeout=_INFLIGHT_TIMEOUT)
+                except FutureTimeoutError:
+                    return jsonify({'error': 'Upstream request timed out'}), 504
+                if status == 200:
+                    return _etag_response(body, etag, ttl)
+                return Response(body, status=status, mimetype='application/json')
+
+            try:
+                response = app.make_response(view(*args, **kwargs))
+                body, status, etag = response.get_data(), response.status_code, None
+                if status == 200:
+                    etag = hashlib.md5(body, usedforsecurity=False).hexdigest()
+                    _cache_set(key, body, etag, ttl)
+                    response = _etag_response(body, etag, ttl)
+                future.set_result((body, status, etag))
+                return response
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            finally:
+                with _INFLIGHT_LOCK:
+                    del _INFLIGHT[key]
+        return wrapper
+    return decorator
+
+
+def _trending_cache_key():
+    return f"v1:trending:{request.args.get('category', 'general')}"
+
+
+def _search_cache_key():
+    data = request.get_json(silent=True)
+    query = data.get('query') if isinstance(data, dict) else None
+    if not query or not isinstance(query, str):
+        return None
+    return f"v1:search:{hashlib.sha1(query.encode()).hexdigest()}"
+
+
+# ============= SUMMARY CACHE =============
+# L1 LRU of Gemini summaries keyed by SHA-256 of the text sent to the model
+_SUMMARY_CACHE = OrderedDict()
+_SUMMARY_CACHE_LOCK = threading.Lock()
+_SUMMARY_CACHE_MAX = 1024
+
+
+def _summary_lookup(text_hash):
+    """Return the cached summary for text_hash, or None"""
+    with _SUMMARY_CACHE_LOCK:
+        summary = _SUMMARY_CACHE.get(text_hash)
+        if summary is not None:
+            _SUMMARY_CACHE.move_to_end(text_hash)
+        return summary
+
+
+def _summary_store(text_hash, summary):
+    """Cache summary under text_hash, evicting the least recently used entry"""
+    with _SUMMARY_CACHE_LOCK:
+        _SUMMARY_CACHE[text_hash] = summary
+        _SUMMARY_CACHE.move_to_end(text_hash)
+        if len(_SUMMARY_CACHE) > _SUMMARY_CACHE_MAX:
+            _SUMMARY_CACHE.popitem(last=False)
+
+
+# Trim text before it is sent to Gemini - cost and latency scale with tokens
+LLM_INPUT_LIMIT = 1500
+_WS_RE = re.compile(r'\s+')
+_BOILERPLATE_RE = re.compile(
+    r'subscribe\b.{0,80}?newsletter|cookie policy|advertisement',
+    re.IGNORECASE
+)
+
+
+def _prep_for_llm(text, limit=LLM_INPUT_LIMIT):
+    """Drop common boilerplate, collapse whitespace and cap text at limit chars"""
+    text = _WS_RE.sub(' ', text)
+    text = _BOILERPLATE_RE.sub('', text)
+    return text.strip()[:limit]
+
+
+# Gemini request settings, shared by every summarization call
+_SUMMARIZE_CONFIG = genai.types.GenerationConfig(
+    temperature=0.7,
+    top_p=0.8,
+    top_k=40,
+    max_output_tokens=200,
+)
+_EXTRACT_CONFIG = genai.types.GenerationConfig(
+    temperature=0.7,
+    top_p=0.8,
+    top_k=40,
+    max_output_tokens=300,
+)
+
+# Safety settings to avoid blocks on ordinary news content
+_SAFETY_SETTINGS = [
+    {'category': category, 'threshold': 'BLOCK_NONE'}
+    for category in (
+        'HARM_CATEGORY_HARASSMENT',
+        'HARM_CATEGORY_HATE_SPEECH',
+        'HARM_CATEGORY_SEXUALLY_EXPLICIT',
+        'HARM_CATEGORY_DANGEROUS_CONTENT',
+    )
+]
+
+_SUMMARIZE_PROMPT = (
+    "Please provide a concise and informative summary of the following article. "
+    "Include the main points and key takeaways in 3-4 sentences.\n\n"
+    "Article:\n{text}\n\n"
+    "Summary:"
+)
+_EXTRACT_PROMPT = (
+    "Please provide a comprehensive summary of this article:\n\n"
+    "Title: {title}\n\n"
+    "Content:\n{text}\n\n"
+    "Provide a summary that includes:\n"
+    "1. Main topic and key points\n"
+    "2. Important facts or findings\n"
+    "3. Conclusions or implications\n\n"
+    "Keep it concise (3-5 sentences).\n\n"
+    "Summary:"
+)
+
+
 # Initialize Gemini AI
+# The model picked on first boot is remembered on disk so later cold starts
+# skip discovery entirely; it is validated lazily by the first real request.
+GEMINI_MODEL_CACHE = os.path.join(tempfile.gettempdir(), 'gemini_model.txt')
+GEMINI_MODEL_CACHE_MAX_AGE = 7 * 24 * 3600
+
 gemini_model = None
-if GEMINI_API_KEY:
+_gemini_model_name = None
+_gemini_model_verified = False
+_gemini_candidates = []
+_gemini_discovered = False
+_gemini_failed_models = set()
+_gemini_lock = threading.Lock()
+
+# Errors meaning the selected model can't serve text prompts at all
+_GEMINI_MODEL_ERRORS = (
+    google_exceptions.NotFound,
+    google_exceptions.InvalidArgument,
+    google_exceptions.PermissionDenied,
+)
+
+
+def _read_cached_model_name():
+    """Return the cached Gemini model name if it is less than a week old"""
     try:
-        genai.configure(api_key=GEMINI_API_KEY)
+        if time.time() - os.path.getmtime(GEMINI_MODEL_CACHE) < GEMINI_MODEL_CACHE_MAX_AGE:
+            with open(GEMINI_MODEL_CACHE) as f:
+                return f.read().strip() or None
+    except OSError:
+        pass
+    return None
+
+
+def _forget_cached_model_name():
+    """Drop the cached model name so the next boot re-runs discovery"""
+    try:
+        os.remove(GEMINI_MODEL_CACHE)
+    except OSError:
+        pass
+
+
+def _discover_model_names():
+    """Return candidate Gemini model names, best match first"""
+    # List available models to find the right one
+    log.info("Checking available Gemini models")
+    available_models = []
+    try:
+        for m in genai.list_models():
+            if 'generateContent' in m.supported_generation_methods:
+                available_models.append(m.name)
+                log.info("Found Gemini model: %s", m.name)
+    except Exception as e:
+        log.warning("Could not list Gemini models: %s", e)
+    
+    # Models in order of preference
+    model_names_to_try = [
+        'gemini-1.5-flash-latest',
+        'gemini-1.5-flash',
+        'gemini-1.5-pro-latest',
+        'gemini-1.5-pro',
+        'gemini-pro',
+        'models/gemini-1.5-flash-latest',
+        'models/gemini-1.5-flash',
+        'models/gemini-pro'
+    ]
+    
+    # Preferred models the API reported first, then anything else it offers,
+    # then the unconfirmed preferences in case listing failed
+    available = set(available_models)
+    confirmed = [name for name in model_names_to_try
+                 if name in available or f'models/{name}' in available]
+    candidates = []
+    for name in confirmed + available_models + model_names_to_try:
+        if name not in candidates:
+            candidates.append(name)
+    return candidates
+
+
+def _use_gemini_model(model_name, verified=False):
+    """Switch the shared Gemini client to model_name"""
+    global gemini_model, _gemini_model_name, _gemini_model_verified
+    gemini_model = genai.GenerativeModel(model_name)
+    _gemini_model_name = model_name
+    _gemini_model_verified = verified
+    log.info("Gemini AI using model: %s", model_name)
+
+
+def _advance_gemini_model(failed_name):
+    """Switch away from failed_name; return False once no candidates are left"""
+    global _gemini_candidates, _gemini_discovered
+    with _gemini_lock:
+        # Another request already moved on from this model
+        if _gemini_model_name != failed_name:
+            return True
         
-        # List available models to find the right one
-        print("\n🔍 Checking available Gemini models...")
-        available_models = []
+        _forget_cached_model_name()
+        _gemini_failed_models.add(failed_name)
+        if not _gemini_discovered:
+            _gemini_candidates = _discover_model_names()
+            _gemini_discovered = True
+        _gemini_candidates = [n for n in _gemini_candidates if n not in _gemini_failed_models]
+        if not _gemini_candidates:
+            return False
+        _use_gemini_model(_gemini_candidates.pop(0))
+        return True
+
+
+def _generate_content(prompt, **kwargs):
+    """Call Gemini, caching the model name on success.
+
+    If the selected model turns out to be unusable, the same prompt is
+    retried on the next candidate; the error is raised only once every
+    candidate has failed.
+    """
+    global _gemini_model_verified
+    while True:
+        with _gemini_lock:
+            model, model_name = gemini_model, _gemini_model_name
         try:
-            for m in genai.list_models():
-                if 'generateContent' in m.supported_generation_methods:
-                    available_models.append(m.name)
-                    print(f"   ✓ Found: {m.name}")
-        except Exception as e:
-            print(f"   ⚠️  Could not list models: {e}")
-        
-        # Try models in order of preference
-        model_names_to_try = [
-            'gemini-1.5-flash-latest',
-            'gemini-1.5-flash',
-            'gemini-1.5-pro-latest',
-            'gemini-1.5-pro',
-            'gemini-pro',
-            'models/gemini-1.5-flash-latest',
-            'models/gemini-1.5-flash',
-            'models/gemini-pro'
-        ]
-        
-        # Add any models we found from the list
-        model_names_to_try.extend(available_models)
-        
-        model_initialized = False
-        for model_name in model_names_to_try:
-            try:
-                gemini_model = genai.GenerativeModel(model_name)
-                # Test the model with a simple request
-                test_response = gemini_model.generate_content("Say 'OK'")
-                if test_response.text:
-                    print(f"✓ Gemini AI initialized successfully with model: {model_name}")
-                    model_initialized = True
-                    break
-            except Exception as e:
-                continue
+            response = model.generate_content(prompt, **kwargs)
+            break
+        except _GEMINI_MODEL_ERRORS as e:
+            log.warning("Gemini model %s unusable: %s", model_name, e)
+            if not _advance_gemini_model(model_name):
+                raise
+    
+    if not _gemini_model_verified:
+        with _gemini_lock:
+            if not _gemini_model_verified and _gemini_model_name == model_name:
+                _gemini_model_verified = True
+                try:
+                    with open(GEMINI_MODEL_CACHE, 'w') as f:
+                        f.write(model_name)
+                except OSError as e:
+                    log.warning("Could not cache Gemini model name: %s", e)
+    return response
+
+
+if GEMINI_API_KEY:
+    try:
+        genai.configure(api_key=GEMINI_API_KEY)
         
-        if not model_initialized:
-            print("❌ Could not initialize any Gemini model")
-            print("   Available models:", available_models if available_models else "None found")
-            gemini_model = None
+        cached_model_name = _read_cached_model_name()
+        if cached_model_name:
+            _use_gemini_model(cached_model_name, verified=True)
+        else:
+            _gemini_candidates = _discover_model_names()
+            _gemini_discovered = True
+            _use_gemini_model(_gemini_candidates.pop(0))
             
     except Exception as e:
-        print(f"⚠️  Gemini AI initialization failed: {e}")
+        log.warning("Gemini AI initialization failed: %s", e)
 
 # Demo articles for when API key is not available
 def get_demo_articles():
@@ -143,13 +565,42 @@ def get_demo_articles():
     return demo_data
 
 
+# One set of demo articles shared by every demo response, plus the serialized
+# bodies built from it keyed by note. Swapped out wholesale once a minute.
+_DEMO_CACHE = {'built_at': 0, 'articles': None, 'bodies': {}}
+_DEMO_CACHE_TTL = 60
+
+
+def _demo_body(note):
+    """Return the demo response JSON for note, rebuilt at most once a minute"""
+    global _DEMO_CACHE
+    now = time.time()
+    cache = _DEMO_CACHE
+    if now - cache['built_at'] > _DEMO_CACHE_TTL:
+        cache = _DEMO_CACHE = {'built_at': now, 'articles': get_demo_articles(), 'bodies': {}}
+    
+    body = cache['bodies'].get(note)
+    if body is None:
+        demo_articles = cache['articles']
+        body = cache['bodies'][note] = orjson.dumps({
+            'status': 'ok',
+            'totalResults': len(demo_articles),
+            'articles': demo_articles,
+            'note': note
+        })
+    return body
+
+
 # ============= SERVE HTML =============
 
 @app.route('/')
 def serve_html():
     """Serve the main HTML file"""
     try:
-        return send_from_directory('.', 'index.html')
+        # send_from_directory adds an ETag and answers If-None-Match with 304
+        response = send_from_directory(STATIC_DIR, 'index.html', max_age=300)
+        response.cache_control.public = True
+        return response
     except Exception as e:
         return jsonify({'error': 'index.html not found', 'message': str(e)}), 404
 
@@ -162,6 +613,7 @@ def serve_index():
 # ============= NEWS ENDPOINTS =============
 
 @app.route('/api/trending', methods=['GET', 'OPTIONS'])
+@cached(ttl=120, key_fn=_trending_cache_key)
 def get_trending():
     """Get trending news by category"""
     if request.method == 'OPTIONS':
@@ -170,20 +622,11 @@ def get_trending():
     category = request.args.get('category', 'general')
     
     if not NEWS_API_KEY:
-        print(f"⚠️  WARNING: No News API key - Using demo data for category: {category}")
-        print(f"   To get real news, add NEWS_API_KEY to your .env file")
-        print(f"   Get your free key at: https://newsapi.org/register")
-        
-        demo_articles = get_demo_articles()
-        print(f"   Generated {len(demo_articles)} demo articles with current timestamps")
-        print(f"   Latest article date: {demo_articles[0]['publishedAt']}")
-        
-        return jsonify({
-            'status': 'ok',
-            'totalResults': len(demo_articles),
-            'articles': demo_articles,
-            'note': 'DEMO DATA - Add NEWS_API_KEY to .env for real news'
-        })
+        log.debug("No News API key - using demo data for category: %s", category)
+        return Response(
+            _demo_body('DEMO DATA - Add NEWS_API_KEY to .env for real news'),
+            mimetype='application/json'
+        )
     
     try:
         url = f"{NEWS_API_BASE}/top-headlines"
@@ -194,33 +637,33 @@ def get_trending():
             'apiKey': NEWS_API_KEY
         }
         
-        print(f"📡 Fetching REAL news from News API for category: {category}")
-        response = requests.get(url, params=params, timeout=10)
-        data = response.json()
+        log.info("Fetching news from News API for category: %s", category)
+        response = SESSION.get(url, params=params, timeout=10)
         
         if response.status_code == 200:
-            print(f"✓ Retrieved {len(data.get('articles', []))} REAL articles from News API")
-            return jsonify(data)
+            # News API already returns JSON - pass the bytes through untouched
+            log.info("Retrieved News API response (%d bytes)", len(response.content))
+            return Response(response.content, mimetype='application/json')
         else:
-            print(f"❌ News API error: {data.get('message', 'Unknown error')}")
-            print(f"   Status code: {response.status_code}")
+            data = response.json()
+            log.warning("News API error %s: %s", response.status_code, data.get('message', 'Unknown error'))
             if response.status_code == 401:
-                print(f"   ERROR: Invalid API key! Check your NEWS_API_KEY in .env")
+                log.error("Invalid News API key - check NEWS_API_KEY in .env")
             elif response.status_code == 429:
-                print(f"   ERROR: Rate limit exceeded. Using demo data as fallback.")
-                return jsonify({
-                    'status': 'ok',
-                    'articles': get_demo_articles(),
-                    'note': 'Rate limit exceeded - showing demo data'
-                })
+                log.warning("News API rate limit exceeded - using demo data as fallback")
+                return Response(
+                    _demo_body('Rate limit exceeded - showing demo data'),
+                    mimetype='application/json'
+                )
             return jsonify({'error': data.get('message', 'Failed to fetch news')}), response.status_code
             
     except Exception as e:
-        print(f"❌ Error fetching news: {str(e)}")
+        log.error("Error fetching news: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/search', methods=['POST', 'OPTIONS'])
+@cached(ttl=60, key_fn=_search_cache_key)
 def search_news():
     """Search news by query"""
     if request.method == 'OPTIONS':
@@ -233,13 +676,11 @@ def search_news():
         return jsonify({'error': 'Query is required'}), 400
     
     if not NEWS_API_KEY:
-        print(f"⚠️  WARNING: No News API key - Using demo data for search: {query}")
-        return jsonify({
-            'status': 'ok',
-            'totalResults': len(get_demo_articles()),
-            'articles': get_demo_articles(),
-            'note': 'DEMO DATA - Add NEWS_API_KEY to .env for real search'
-        })
+        log.debug("No News API key - using demo data for search: %s", query)
+        return Response(
+            _demo_body('DEMO DATA - Add NEWS_API_KEY to .env for real search'),
+            mimetype='application/json'
+        )
     
     try:
         url = f"{NEWS_API_BASE}/everything"
@@ -251,19 +692,19 @@ def search_news():
             'apiKey': NEWS_API_KEY
         }
         
-        print(f"🔍 Searching REAL news for: {query}")
-        response = requests.get(url, params=params, timeout=10)
-        data = response.json()
+        log.info("Searching news for: %s", query)
+        response = SESSION.get(url, params=params, timeout=10)
         
         if response.status_code == 200:
-            print(f"✓ Found {len(data.get('articles', []))} REAL articles")
-            return jsonify(data)
+            log.info("Retrieved search response (%d bytes)", len(response.content))
+            return Response(response.content, mimetype='application/json')
         else:
-            print(f"❌ Search error: {data.get('message', 'Unknown error')}")
+            data = response.json()
+            log.warning("Search error %s: %s", response.status_code, data.get('message', 'Unknown error'))
             return jsonify({'error': data.get('message', 'Search failed')}), response.status_code
             
     except Exception as e:
-        print(f"❌ Search error: {str(e)}")
+        log.error("Search error: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -277,84 +718,59 @@ def summarize_article():
         
     try:
         data = request.get_json()
-        print(f"\n📝 Summarize request received")
-        print(f"   Data received: {bool(data)}")
         
         if not data:
-            print("❌ No JSON data received")
+            log.info("Summarize request without JSON data")
             return jsonify({'error': 'No data received'}), 400
             
         text = data.get('text', '')
-        print(f"   Text length: {len(text)} characters")
+        log.debug("Summarize request for %d characters", len(text))
         
         if not text:
-            print("❌ No text provided")
+            log.info("Summarize request without text")
             return jsonify({'error': 'Text is required'}), 400
         
         if not gemini_model:
-            print("⚠️  Gemini AI not configured, returning demo response")
+            log.debug("Gemini AI not configured, returning demo response")
             return jsonify({
                 'summary': 'This is a demo summary. To get real AI-powered summaries, please configure your Gemini API key in the .env file. Visit https://makersuite.google.com/app/apikey to get your free API key.',
                 'ai_model': 'Demo Mode',
                 'note': 'Gemini API key not configured'
             }), 200
         
-        prompt = f"""Please provide a concise and informative summary of the following article. 
-        Include the main points and key takeaways in 3-4 sentences.
-        
-        Article:
-        {text[:3000]}
-        
-        Summary:"""
-        
-        print("✨ Generating AI summary with Gemini...")
-        
-        # Configure generation settings for better results
-        generation_config = genai.types.GenerationConfig(
-            temperature=0.7,
-            top_p=0.8,
-            top_k=40,
-            max_output_tokens=500,
-        )
+        article_text = _prep_for_llm(text)
+        text_hash = hashlib.sha256(article_text.encode()).hexdigest()
+        summary = _summary_lookup(text_hash)
+        if summary is not None:
+            log.debug("Summary served from cache")
+            return jsonify({
+                'summary': summary,
+                'original_length': len(text),
+                'summary_length': len(summary),
+                'ai_model': 'Gemini Pro'
+            })
         
-        # Add safety settings to avoid blocks
-        safety_settings = [
-            {
-                "category": "HARM_CATEGORY_HARASSMENT",
-                "threshold": "BLOCK_NONE",
-            },
-            {
-                "category": "HARM_CATEGORY_HATE_SPEECH",
-                "threshold": "BLOCK_NONE",
-            },
-            {
-                "category": "HARM_CATEGORY_SEXUALLY_EXPLICIT",
-                "threshold": "BLOCK_NONE",
-            },
-            {
-                "category": "HARM_CATEGORY_DANGEROUS_CONTENT",
-                "threshold": "BLOCK_NONE",
-            },
-        ]
+        log.debug("Generating AI summary with Gemini")
         
-        response = gemini_model.generate_content(
-            prompt,
-            generation_config=generation_config,
-            safety_settings=safety_settings
+        response = _generate_content(
+            _SUMMARIZE_PROMPT.format(text=article_text),
+            generation_config=_SUMMARIZE_CONFIG,
+            safety_settings=_SAFETY_SETTINGS
         )
         
         # Check if response was blocked
         if not response.text:
             if response.prompt_feedback:
-                print(f"⚠️  Response blocked: {response.prompt_feedback}")
+                log.warning("Gemini response blocked: %s", response.prompt_feedback)
             return jsonify({
                 'error': 'Content generation was blocked by safety filters',
                 'summary': 'Unable to generate summary for this content.'
             }), 200
         
         summary = response.text
+        _summary_store(text_hash, summary)
         
-        print(f"✓ Summary generated successfully ({len(summary)} characters)")
+        log.info("Summary generated (%d characters)", len(summary))
         return jsonify({
             'summary': summary,
             'original_length': len(text),
@@ -363,14 +779,132 @@ def summarize_article():
         })
         
     except Exception as e:
-        print(f"❌ Gemini AI error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Gemini AI error: %s", e)
         return jsonify({
             'error': f'AI summarization failed: {str(e)}',
             'details': 'Check server logs for more information'
         }), 500
 
+
+MAX_HTML_BYTES = 2 * 1024 * 1024
+
+# Extraction settings, built once instead of on every request
+_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+_REMOVE_TAGS = ['script', 'style', 'nav', 'footer', 'header', 'aside']
+_CONTENT_SELECTORS = ('article', 'main', '[role="main"]', '.article-content', '.post-content', '.entry-content')
+
+
+def _parse_article(html):
+    """Return (title, content) extracted from raw HTML bytes.
+
+    Pure CPU work with no shared state, so it is safe to call from any thread
+    or hand to an executor.
+    """
+    tree = HTMLParser(html)
+    
+    # Remove unwanted elements
+    tree.strip_tags(_REMOVE_TAGS)
+    
+    # Get title
+    title = tree.css_first('title')
+    title_text = title.text(strip=True) if title else 'No title found'
+    
+    # Extract main content
+    article_content = ''
+    
+    # Try common article containers
+    for selector in _CONTENT_SELECTORS:
+        content = tree.css_first(selector)
+        if content:
+            article_content = content.text(separator=' ', strip=True)
+            break
+    
+    # Fallback to paragraphs
+    if not article_content:
+        paragraphs = (p.text().strip() for p in tree.css('p'))
+        article_content = ' '.join(text for text in paragraphs if text)
+    
+    # Clean up whitespace
+    article_content = ' '.join(article_content.split())
+    
+    return title_text, article_content
+
+
+def _fetch_article(url):
+    """Download url and return (title, content) extracted from its HTML"""
+    # Stream the body and stop at MAX_HTML_BYTES - only the first few KB of
+    # article text are kept, so the rest of a large page is never downloaded
+    html = bytearray()
+    with SESSION.get(url, headers=_HEADERS, timeout=15, stream=True) as response:
+        response.raise_for_status()
+        for chunk in response.iter_content(chunk_size=65536):
+            html.extend(chunk)
+            if len(html) >= MAX_HTML_BYTES:
+                break
+    
+    return _parse_article(bytes(html[:MAX_HTML_BYTES]))
+
+
+def _extract_article(url, summarize=True):
+    """Fetch url, extract the article and optionally summarize it.
+
+    Uses no Flask request state, so it can run on any worker thread.
+    Raises requests.exceptions.RequestException if the page can't be fetched.
+    """
+    log.info("Extracting content from: %s", url)
+    title_text, article_content = _fetch_article(url)
+    
+    log.debug("Extracted %d characters", len(article_content))
+    
+    result = {
+        'url': url,
+        'title': title_text,
+        'content': article_content[:5000],
+        'content_length': len(article_content)
+    }
+    
+    # Generate AI summary if requested
+    if summarize and article_content and gemini_model:
+        try:
+            log.debug("Generating AI summary for extracted content")
+            
+            prompt = _EXTRACT_PROMPT.format(title=title_text, text=_prep_for_llm(article_content))
+            summary_response = _generate_content(
+                prompt,
+                generation_config=_EXTRACT_CONFIG
+            )
+            result['summary'] = summary_response.text
+            result['ai_model'] = 'Gemini 1.5'
+            log.debug("Summary generated for extracted content")
+            
+        except Exception as e:
+            log.warning("Summary generation failed: %s", e)
+            result['summary'] = "Summary generation unavailable. Please configure Gemini API key."
+    elif summarize and not gemini_model:
+        result['summary'] = "AI summarization unavailable. Please configure Gemini API key in .env file."
+    
+    return result
+
+
+# Shared pool for batch extraction; its size also bounds concurrent Gemini calls
+_EXTRACT_POOL = ThreadPoolExecutor(max_workers=10)
+MAX_BATCH_URLS = 20
+
+
+def _extract_article_safe(url, summarize):
+    """Run _extract_article, returning an error entry instead of raising"""
+    try:
+        return _extract_article(url, summarize)
+    except requests.exceptions.RequestException as e:
+        log.warning("Failed to fetch URL %s: %s", url, e)
+        return {'url': url, 'error': f'Failed to fetch URL: {str(e)}'}
+    except Exception as e:
+        log.error("Error processing URL %s: %s", url, e)
+        return {'url': url, 'error': str(e)}
+
+
 @app.route('/api/extract-url', methods=['POST', 'OPTIONS'])
 def extract_from_url():
     """Extract article content from URL and summarize"""
@@ -385,103 +919,44 @@ def extract_from_url():
         return jsonify({'error': 'URL is required'}), 400
     
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        print(f"🔗 Extracting content from: {url}")
-        response = requests.get(url, headers=headers, timeout=15)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Remove unwanted elements
-        for element in soup(['script', 'style', 'nav', 'footer', 'header', 'aside']):
-            element.decompose()
-        
-        # Get title
-        title = soup.find('title')
-        title_text = title.get_text().strip() if title else 'No title found'
-        
-        # Extract main content
-        article_content = ''
-        
-        # Try common article containers
-        for selector in ['article', 'main', '[role="main"]', '.article-content', '.post-content', '.entry-content']:
-            content = soup.select_one(selector)
-            if content:
-                article_content = content.get_text(separator=' ', strip=True)
-                break
-        
-        # Fallback to paragraphs
-        if not article_content:
-            paragraphs = soup.find_all('p')
-            article_content = ' '.join([p.get_text().strip() for p in paragraphs if p.get_text().strip()])
-        
-        # Clean up whitespace
-        article_content = ' '.join(article_content.split())
-        
-        print(f"✓ Extracted {len(article_content)} characters")
-        
-        result = {
-            'url': url,
-            'title': title_text,
-            'content': article_content[:5000],
-            'content_length': len(article_content)
-        }
-        
-        # Generate AI summary if requested
-        if summarize and article_content and gemini_model:
-            try:
-                prompt = f"""Please provide a comprehensive summary of this article:
-                
-                Title: {title_text}
-                
-                Content:
-                {article_content[:3000]}
-                
-                Provide a summary that includes:
-                1. Main topic and key points
-                2. Important facts or findings
-                3. Conclusions or implications
-                
-                Keep it concise (3-5 sentences).
-                
-                Summary:"""
-                
-                print("✨ Generating AI summary for extracted content...")
-                
-                generation_config = {
-                    'temperature': 0.7,
-                    'top_p': 0.8,
-                    'top_k': 40,
-                    'max_output_tokens': 800,
-                }
-                
-                summary_response = gemini_model.generate_content(
-                    prompt,
-                    generation_config=generation_config
-                )
-                result['summary'] = summary_response.text
-                result['ai_model'] = 'Gemini 1.5'
-                print("✓ Summary generated successfully")
-                
-            except Exception as e:
-                print(f"⚠️  Summary generation failed: {str(e)}")
-                result['summary'] = "Summary generation unavailable. Please configure Gemini API key."
-        elif summarize and not gemini_model:
-            result['summary'] = "AI summarization unavailable. Please configure Gemini API key in .env file."
-        
-        return jsonify(result)
+        return jsonify(_extract_article(url, summarize))
         
     except requests.exceptions.RequestException as e:
-        print(f"❌ Failed to fetch URL: {str(e)}")
+        log.warning("Failed to fetch URL %s: %s", url, e)
         return jsonify({'error': f'Failed to fetch URL: {str(e)}'}), 500
     except Exception as e:
-        print(f"❌ Error processing URL: {str(e)}")
+        log.error("Error processing URL %s: %s", url, e)
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/api/extract-urls', methods=['POST', 'OPTIONS'])
+def extract_urls_batch():
+    """Extract and summarize several URLs concurrently"""
+    if request.method == 'OPTIONS':
+        return '', 204
+        
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({'error': 'JSON object body is required'}), 400
+    urls = data.get('urls', [])
+    summarize = data.get('summarize', True)
+    
+    if not urls or not isinstance(urls, list):
+        return jsonify({'error': 'A non-empty list of URLs is required'}), 400
+    if not all(isinstance(u, str) and u for u in urls):
+        return jsonify({'error': 'Every URL must be a non-empty string'}), 400
+    if len(urls) > MAX_BATCH_URLS:
+        return jsonify({'error': f'At most {MAX_BATCH_URLS} URLs per request'}), 400
+    
+    log.info("Batch extracting %d URLs", len(urls))
+    results = list(_EXTRACT_POOL.map(lambda u: _extract_article_safe(u, summarize), urls))
+    
+    return jsonify({
+        'results': results,
+        'count': len(results)
+    })
+
+
 # ============= HEALTH CHECK =============
 
 @app.route('/api/health', methods=['GET'])
@@ -496,14 +971,11 @@ def health_check():
             'trending': '/api/trending?category=general',
             'search': '/api/search (POST)',
             'summarize': '/api/summarize (POST)',
-            'extract_url': '/api/extract-url (POST)'
+            'extract_url': '/api/extract-url (POST)',
+            'extract_urls': '/api/extract-urls (POST)'
         }
     }
     
-    print("🏥 Health check requested")
-    print(f"   News API: {'✓ Configured' if NEWS_API_KEY else '✗ Not configured (using demo data)'}")
-    print(f"   Gemini AI: {'✓ Configured' if gemini_model else '✗ Not configured'}")
-    
     return jsonify(status)
 
 @app.route('/api/test', methods=['GET'])
@@ -531,7 +1003,8 @@ def not_found(error):
             'GET /api/trending?category=general': 'Get trending news',
             'POST /api/search': 'Search news',
             'POST /api/summarize': 'Summarize text',
-            'POST /api/extract-url': 'Extract & summarize URL'
+            'POST /api/extract-url': 'Extract & summarize URL',
+            'POST /api/extract-urls': 'Extract & summarize several URLs'
         }
     }), 404
 
@@ -550,8 +1023,9 @@ def method_not_allowed(error):
 
 
 # ============= RUN SERVER FOR LOCAL ONLY =============
+# Production: gunicorn -c gunicorn.conf.py wsgi:application
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5000)
+    app.run(host="0.0.0.0", port=5000, debug=False)
 
 # ============= VERCEL SERVERLESS ENTRYPOINT =============
 # Expose the Flask WSGI app (required by Vercel)
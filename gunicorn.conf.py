@@ -0,0 +1,16 @@
+# gunicorn.conf.py - Production server settings for AI News Hub
+# Usage: gunicorn -c gunicorn.conf.py wsgi:application
+import multiprocessing
+import os
+
+bind = os.getenv('BIND', '0.0.0.0:5000')
+
+# Requests are I/O-bound (News API, article fetches, Gemini), so each worker
+# runs many greenlets instead of blocking a thread per request
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+worker_class = 'gevent'
+worker_connections = 1000
+
+# Keep client connections open between requests (e.g. behind a proxy)
+keepalive = 75
+timeout = 60
@@ -0,0 +1,4 @@
+# wsgi.py - WSGI entrypoint for running AI News Hub under gunicorn
+from api.index import app
+
+application = app